@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Shared admin bootstrap operations
+
+Single home for the configuration, MongoDB client, and upsert logic that
+create_admin.py and init_admin.py previously duplicated. Both shims call
+upsert_admin(), so the cached config, pooled client, and lazy imports
+apply once instead of twice.
+"""
+import atexit
+import functools
+import os
+from datetime import datetime
+
+# .env is parsed at most once per process; repeated _config() calls
+# return the same resolved dict. Matters because init_admin runs on
+# every server start.
+_LOADED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _config() -> dict:
+    global _LOADED
+    if not _LOADED:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '.env'))
+        except Exception:
+            pass
+        _LOADED = True
+    return {
+        'MONGO_URL': os.environ.get('MONGO_URL') or 'mongodb://localhost:27017',
+        'DATABASE_NAME': os.environ.get('DATABASE_NAME'),
+        'ADMIN_EMAIL': os.environ.get('ADMIN_EMAIL'),
+        'ADMIN_PASSWORD': os.environ.get('ADMIN_PASSWORD'),
+        'ADMIN_NAME': os.environ.get('ADMIN_NAME', 'Administrator'),
+    }
+
+
+def hash_password(password: str) -> str:
+    """Hash password with argon2, matching the app's auth logic
+
+    The app still recognizes legacy 64-hex SHA-256 hashes and rehashes
+    them on the next successful login, so existing users are unaffected.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=['argon2'], deprecated='auto').hash(password)
+
+
+@functools.lru_cache(maxsize=1)
+def get_mongo_client():
+    """Get the shared MongoDB client for admin operations"""
+    # pymongo's import cascade (~30 submodules) is deferred to first use,
+    # keeping --help and env-validation paths import-light
+    from pymongo import MongoClient
+
+    # Validated TLS against the certifi CA bundle; only applies when
+    # the URL enables TLS (mongodb+srv)
+    try:
+        import certifi
+        tls_kwargs = {'tlsCAFile': certifi.where()}
+    except ImportError:
+        tls_kwargs = {}
+
+    # MongoClient is itself a connection pool - one per process, reused
+    # across calls instead of paying topology discovery each time
+    client = MongoClient(
+        _config()['MONGO_URL'],
+        maxPoolSize=10,
+        minPoolSize=1,
+        serverSelectionTimeoutMS=15000,
+        appname='admin-init',
+        # Wire compression, matching the app's client settings
+        compressors='zstd,snappy',
+        **tls_kwargs,
+    )
+    atexit.register(client.close)
+    return client
+
+
+def get_database(client):
+    """Pick the target database:
+    1. DATABASE_NAME env var if present
+    2. The database named in the Mongo URI
+    3. Fallback to 'tax_portal'
+    """
+    db_name = _config()['DATABASE_NAME']
+    if db_name:
+        return client[db_name]
+    try:
+        db = client.get_default_database()
+        # get_default_database may return a Database even when none
+        # specified; ensure it has a name
+        if not getattr(db, 'name', None):
+            raise Exception("No default database in URI")
+        return db
+    except Exception:
+        return client['tax_portal']
+
+
+# The admin document shape is fixed at import time; the invariant part
+# of the $set operator is hoisted here so each upsert only fills in the
+# varying fields before BSON encoding
+_ADMIN_SET_CONST = {'is_admin': True, 'roles': ['admin']}
+
+# Index creation is issued at most once per process
+_indexed = False
+
+
+def get_users_collection(db, fast_writes=False):
+    """Get the users collection, ensuring the unique email index exists
+
+    Args:
+        fast_writes: Use w=1, j=False write concern - acceptable for the
+            idempotent per-boot bootstrap, which would otherwise wait for
+            majority journal acknowledgement on Atlas
+    """
+    global _indexed
+    if fast_writes:
+        from pymongo import WriteConcern
+        users = db.get_collection('users', write_concern=WriteConcern(w=1, j=False))
+    else:
+        users = db.get_collection('users')
+    if not _indexed:
+        # Unique index keeps the upsert race-safe and the email probe
+        # indexed; create_index is a no-op when it already exists
+        from pymongo import ASCENDING
+        users.create_index([('email', ASCENDING)], unique=True,
+                           name='email_unique', background=True)
+        _indexed = True
+    return users
+
+
+def _bootstrap_marker(db, email: str, password: str):
+    """Return the bootstrap marker if it matches the configured credentials
+
+    argon2 hashes are salted, so the stored hash is verified against the
+    password rather than compared for equality.
+    """
+    marker = db.get_collection('_system').find_one(
+        {'_id': 'admin_bootstrap'},
+        {'email': 1, 'pw_hash': 1, 'user_id': 1},
+    )
+    if not marker or marker.get('email') != email:
+        return None
+    try:
+        from passlib.context import CryptContext
+        if CryptContext(schemes=['argon2']).verify(password, marker.get('pw_hash', '')):
+            return marker
+    except Exception:
+        return None
+    return None
+
+
+def upsert_admin(email: str, password: str, name: str = 'Administrator',
+                 skip_if_bootstrapped: bool = False):
+    """Create or promote the admin user in a single upsert
+
+    Args:
+        skip_if_bootstrapped: Short-circuit when the bootstrap marker shows
+            these exact credentials were already applied (used by the
+            per-boot init_admin path)
+
+    Returns:
+        (user_id, created, db_name) - created is True when the user was
+        inserted rather than updated
+    """
+    client = get_mongo_client()
+    db = get_database(client)
+    # The per-boot path trades durability for latency; the interactive
+    # create_admin path keeps the default (confirmed) write concern
+    users = get_users_collection(db, fast_writes=skip_if_bootstrapped)
+
+    if skip_if_bootstrapped:
+        marker = _bootstrap_marker(db, email, password)
+        if marker is not None:
+            return marker.get('user_id'), False, db.name
+
+    # No up-front ping - server selection happens lazily and the write
+    # below surfaces connection errors itself. Opt back in for debugging
+    # with ADMIN_INIT_DIAGNOSE=1.
+    if os.environ.get('ADMIN_INIT_DIAGNOSE'):
+        try:
+            client.admin.command('ping')
+            print(f"Connected to MongoDB server; using database: '{db.name}'")
+        except Exception as e:
+            print("Warning: Unable to ping MongoDB server. Connection/auth may fail.")
+            print(str(e))
+
+    # Hash and timestamp computed once, before the round-trip, so both
+    # operator maps reference the same values
+    pw_hash = hash_password(password)
+    now = datetime.utcnow()
+    result = users.update_one(
+        {'email': email},
+        {
+            '$set': dict(_ADMIN_SET_CONST, password=pw_hash, name=name, updated_at=now),
+            '$setOnInsert': {
+                'email': email,
+                'created_at': now,
+            },
+        },
+        upsert=True,
+    )
+
+    if result.upserted_id is not None:
+        user_id, created = result.upserted_id, True
+    else:
+        # Projected follow-up only because callers print the id
+        user_id = users.find_one({'email': email}, {'_id': 1})['_id']
+        created = False
+
+    if skip_if_bootstrapped:
+        # Record what was applied so the next boot can short-circuit
+        db.get_collection('_system').update_one(
+            {'_id': 'admin_bootstrap'},
+            {'$set': {'email': email, 'pw_hash': pw_hash, 'user_id': user_id}},
+            upsert=True,
+        )
+
+    return user_id, created, db.name
@@ -2,13 +2,21 @@
 Authentication API Routes
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Header
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Request
 from typing import Optional
+import asyncio
 import hashlib
+import hmac
 import logging
+import secrets
+import time
+
+from bson.binary import Binary
+from passlib.context import CryptContext
+from pymongo import ReturnDocument
 
 from ..schemas.auth import LoginRequest, LoginResponse, UserCreate, UserResponse
+from ..utils import utcnow
 from ..core.database import get_db
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -19,10 +27,97 @@ router = APIRouter(prefix="", tags=["Authentication"])
 # Simple token storage (in production, use JWT or session management)
 SECRET_KEY = "-secret-key-change-in-production"
 
+# Password hashing context (argon2 KDF)
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
 
 def hash_password(password: str) -> str:
-    """Hash password using SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash password using argon2"""
+    return pwd_context.hash(password)
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """
+    Verify password against stored hash in constant time
+    Supports argon2 hashes and legacy SHA256 hex digests
+    """
+    if not stored_hash:
+        return False
+    if stored_hash.startswith("$"):
+        try:
+            return pwd_context.verify(password, stored_hash)
+        except ValueError:
+            return False
+    # Legacy SHA256 hash - compare in constant time
+    legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(stored_hash, legacy_hash)
+
+
+def password_needs_rehash(stored_hash: str) -> bool:
+    """Check if a stored hash should be upgraded to argon2"""
+    if not stored_hash.startswith("$"):
+        return True
+    return pwd_context.needs_update(stored_hash)
+
+
+def hash_token(token: str) -> bytes:
+    """Hash an access token for storage and lookup"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+# In-process TTL cache for token -> user resolution.
+# Avoids a MongoDB round-trip on every authenticated request.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: dict = {}
+
+
+def _cache_get_user(token_hash: bytes) -> Optional[dict]:
+    """Get a cached user for a token hash if the entry is still fresh"""
+    entry = _token_cache.get(token_hash)
+    if entry is None:
+        return None
+    expires_at, user = entry
+    if time.monotonic() >= expires_at:
+        _token_cache.pop(token_hash, None)
+        return None
+    return user
+
+
+def _cache_put_user(token_hash: bytes, user: dict) -> None:
+    """Cache a resolved user, evicting the oldest entry when full"""
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[token_hash] = (time.monotonic() + _TOKEN_CACHE_TTL, user)
+
+
+def _cache_invalidate_user(token_hash: bytes) -> None:
+    """Remove a token from the cache (e.g. on logout)"""
+    _token_cache.pop(token_hash, None)
+
+
+# Login rate limiting - sliding window per client IP + email.
+# Short-circuits brute-force attempts before any hashing or DB work.
+_LOGIN_RATE_LIMIT = 5
+_LOGIN_RATE_WINDOW = 60.0
+_LOGIN_RATE_MAX_KEYS = 10000
+_login_attempts: dict = {}
+
+
+def _check_login_rate_limit(key: str) -> bool:
+    """Record a login attempt and return False when the key is over the limit"""
+    now = time.monotonic()
+    attempts = [t for t in _login_attempts.get(key, ()) if now - t < _LOGIN_RATE_WINDOW]
+    if len(attempts) >= _LOGIN_RATE_LIMIT:
+        _login_attempts[key] = attempts
+        return False
+    attempts.append(now)
+    if len(_login_attempts) >= _LOGIN_RATE_MAX_KEYS and key not in _login_attempts:
+        # Drop expired windows so the table stays bounded
+        for stale in [k for k, v in _login_attempts.items() if now - v[-1] >= _LOGIN_RATE_WINDOW]:
+            del _login_attempts[stale]
+    _login_attempts[key] = attempts
+    return True
 
 
 async def get_current_user(
@@ -37,51 +132,94 @@ async def get_current_user(
         )
     
     token = authorization.replace("Bearer ", "")
+    token_hash = hash_token(token)
+
+    cached = _cache_get_user(token_hash)
+    if cached is not None:
+        return cached
+
     users_collection = db.get_collection("users")
-    user = await users_collection.find_one({"token": token})
+    # Keep the password and token hashes out of the returned document -
+    # nothing downstream needs them and they shouldn't travel per request
+    user = await users_collection.find_one(
+        {"token_hash": Binary(token_hash)},
+        projection={"password": 0, "token_hash": 0}
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
         )
+    _cache_put_user(token_hash, user)
     return user
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(login_data: LoginRequest, db: AsyncIOMotorDatabase = Depends(get_db)):
+async def login(
+    login_data: LoginRequest,
+    request: Request,
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
     """Login user and return access token"""
+    client_ip = request.client.host if request.client else "unknown"
+    if not _check_login_rate_limit(f"{client_ip}:{login_data.email}"):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later."
+        )
+
     users_collection = db.get_collection("users")
     
-    # Find user
-    logger.info(f"Attempting login for email: {login_data.email}")
-    user = await users_collection.find_one({"email": login_data.email})
+    # Find user - only the password hash is needed for verification
+    logger.debug("Attempting login for email: %s", login_data.email)
+    user = await users_collection.find_one(
+        {"email": login_data.email},
+        projection={"password": 1}
+    )
     if not user:
-        logger.warning(f"User not found: {login_data.email}")
+        logger.warning("User not found: %s", login_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    # Verify password
-    hashed_password = hash_password(login_data.password)
-    logger.info(f"Password check: input_hash={hashed_password[:16]}..., stored_hash={user.get('password', '')[:16]}...")
-    if user.get("password") != hashed_password:
-        logger.warning(f"Password mismatch for {login_data.email}")
+    # Verify password off the event loop - argon2 verification takes
+    # long enough to stall other requests if run inline
+    verified = await asyncio.to_thread(
+        verify_password, login_data.password, user.get("password", "")
+    )
+    if not verified:
+        logger.warning("Password mismatch for %s", login_data.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
-    
+
     # Generate simple token (in production, use JWT)
-    import secrets
     token = secrets.token_urlsafe(32)
-    
-    # Store token in user document
-    await users_collection.update_one(
+
+    # Store only the token hash, upgrading legacy password hashes lazily
+    update_fields = {
+        "token_hash": Binary(hash_token(token)),
+        "last_login": utcnow()
+    }
+    if password_needs_rehash(user.get("password", "")):
+        update_fields["password"] = await asyncio.to_thread(
+            hash_password, login_data.password
+        )
+
+    # Set the token and fetch the full document in one round-trip
+    user = await users_collection.find_one_and_update(
         {"_id": user["_id"]},
-        {"$set": {"token": token, "last_login": datetime.utcnow()}}
+        {"$set": update_fields, "$unset": {"token": ""}},
+        return_document=ReturnDocument.AFTER
     )
-    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password"
+        )
+
     return LoginResponse(
         access_token=token,
         token_type="bearer",
@@ -106,12 +244,18 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(current_user: dict = Depends(get_current_user), db: AsyncIOMotorDatabase = Depends(get_db)):
+async def logout(
+    authorization: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
     """Logout user"""
     users_collection = db.get_collection("users")
     await users_collection.update_one(
         {"_id": current_user["_id"]},
-        {"$unset": {"token": ""}}
+        {"$unset": {"token_hash": "", "token": ""}}
     )
+    if authorization and authorization.startswith("Bearer "):
+        _cache_invalidate_user(hash_token(authorization.replace("Bearer ", "")))
     return {"message": "Logged out successfully"}
 
@@ -6,16 +6,20 @@ Handles all HTTP endpoints for contact form submissions
 from fastapi import APIRouter, Query, HTTPException, status
 import logging
 
-from ..schemas import ContactCreate, ContactResponse, ContactListResponse, ContactCountResponse
+from ..schemas import ContactCreate, ContactResponse, ContactCountResponse
 from ..services import ContactService
-from ..core import ContactNotFoundException, InvalidObjectIDException, DatabaseException
+from ..core import ContactNotFoundException, InvalidObjectIDException, DatabaseException, MongoJSONResponse
+from ..core.responses import PydanticResponse
+from ..utils import build_contact_model
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
 
-@router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
+# response_model_by_alias=False keeps the id under "id", matching the
+# orjson/PydanticResponse endpoints which all emit the renamed key
+@router.post("/", response_model=ContactResponse, response_model_by_alias=False, status_code=status.HTTP_201_CREATED)
 async def create_contact(contact: ContactCreate):
     """
     Submit a new contact form
@@ -24,8 +28,7 @@ async def create_contact(contact: ContactCreate):
         Created contact submission with ID and timestamp
     """
     try:
-        contact_dict = contact.model_dump(exclude_none=True)
-        return await ContactService.create_contact(contact_dict)
+        return await ContactService.create_contact(contact)
     except DatabaseException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -33,7 +36,7 @@ async def create_contact(contact: ContactCreate):
         )
 
 
-@router.get("/", response_model=ContactListResponse)
+@router.get("/")
 async def get_all_contacts(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100)
@@ -45,7 +48,9 @@ async def get_all_contacts(
     - **limit**: Number of records to return (default: 10, max: 100)
     """
     try:
-        return await ContactService.get_all_contacts(skip, limit)
+        # Serialize the Motor documents once with orjson - skips the
+        # jsonable_encoder + response_model re-validation pass
+        return MongoJSONResponse(await ContactService.get_all_contacts(skip, limit))
     except DatabaseException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -53,7 +58,7 @@ async def get_all_contacts(
         )
 
 
-@router.get("/{id}", response_model=ContactResponse)
+@router.get("/{id}")
 async def get_contact_by_id(id: str):
     """
     Get specific contact submission by ID
@@ -61,7 +66,10 @@ async def get_contact_by_id(id: str):
     - **id**: Contact submission ID
     """
     try:
-        return await ContactService.get_contact_by_id(id)
+        # Construct from the trusted DB document and serialize directly -
+        # no response_model re-validation pass
+        document = await ContactService.get_contact_by_id(id)
+        return PydanticResponse(build_contact_model(document))
     except InvalidObjectIDException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
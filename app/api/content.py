@@ -4,13 +4,24 @@ Handles all HTTP endpoints for content management
 """
 
 from fastapi import APIRouter, Query, HTTPException, status, Depends, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 import logging
 
-from ..schemas import ContentCreate, ContentUpdate, ContentResponse, ContentListResponse, BulkSeedResponse
+from ..schemas import (
+    ContentCategory,
+    ContentType,
+    ContentCreate,
+    ContentUpdate,
+    ContentResponse,
+    BulkSeedResponse
+)
 from ..services import ContentService
-from ..core import ContentNotFoundException, InvalidObjectIDException, DatabaseException
+from ..core import ContentNotFoundException, InvalidObjectIDException, DatabaseException, MongoJSONResponse
+from ..core.responses import PydanticResponse
+from ..utils import build_content_model
 from ..api.auth import get_current_user
+from ..api.seo import invalidate_sitemap_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +47,8 @@ async def get_all_contents(
         return {}
 
     try:
-        return await ContentService.get_all_contents(skip, limit, q)
+        # Serialize the Motor documents once with orjson
+        return MongoJSONResponse(await ContentService.get_all_contents(skip, limit, q))
     except DatabaseException as e:
         logger.error(f"Error fetching contents: {str(e)}")
         raise HTTPException(
@@ -45,11 +57,63 @@ async def get_all_contents(
         )
 
 
-@router.get("/item/{id}", response_model=ContentResponse)
+@router.get("/cursor")
+async def get_contents_cursor(
+    after: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(10, ge=1, le=100)
+):
+    """
+    Get contents with keyset pagination
+
+    - **after**: Opaque cursor returned as next_cursor by the previous page
+    - **limit**: Number of records to return (default: 10, max: 100)
+    """
+    try:
+        return MongoJSONResponse(await ContentService.get_all_contents_cursor(after, limit))
+    except InvalidObjectIDException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except DatabaseException as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.get("/export")
+async def export_contents(
+    category: Optional[str] = Query(None),
+    type: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Stream all contents as NDJSON (admin only)
+
+    Each line is one content document - the response streams straight
+    from the database cursor instead of buffering the full dump.
+    """
+    if not current_user.get("is_admin", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can export content"
+        )
+
+    return StreamingResponse(
+        ContentService.stream_all_contents(category, type),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/item/{id}")
 async def get_content_by_id(id: str):
     """Get a specific content by ID"""
     try:
-        return await ContentService.get_content_by_id(id)
+        # Construct from the trusted DB document and serialize directly -
+        # no response_model re-validation pass
+        document = await ContentService.get_content_by_id(id)
+        return PydanticResponse(build_content_model(document))
     except InvalidObjectIDException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,8 +134,8 @@ async def get_content_by_id(id: str):
 @router.api_route("/{category}/{type}", methods=["GET", "OPTIONS"])
 async def get_contents_by_filter(
     request: Request,
-    category: str,
-    type: str,
+    category: ContentCategory,
+    type: ContentType,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     q: Optional[str] = Query(None)
@@ -90,7 +154,9 @@ async def get_contents_by_filter(
         return {}
 
     try:
-        return await ContentService.get_contents_by_filter(category, type, skip, limit, q)
+        return MongoJSONResponse(
+            await ContentService.get_contents_by_filter(category.value, type.value, skip, limit, q)
+        )
     except DatabaseException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -98,7 +164,7 @@ async def get_contents_by_filter(
         )
 
 
-@router.get("/category/{category}", response_model=ContentListResponse)
+@router.get("/category/{category}")
 async def get_contents_by_category(
     category: str,
     skip: int = Query(0, ge=0),
@@ -112,7 +178,7 @@ async def get_contents_by_category(
     - **limit**: Number of records to return
     """
     try:
-        return await ContentService.get_contents_by_category(category, skip, limit)
+        return MongoJSONResponse(await ContentService.get_contents_by_category(category, skip, limit))
     except DatabaseException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -120,7 +186,9 @@ async def get_contents_by_category(
         )
 
 
-@router.post("/", response_model=ContentResponse, status_code=status.HTTP_201_CREATED)
+# response_model_by_alias=False keeps the id under "id", matching the
+# orjson/PydanticResponse endpoints which all emit the renamed key
+@router.post("/", response_model=ContentResponse, response_model_by_alias=False, status_code=status.HTTP_201_CREATED)
 async def create_content(
     content: ContentCreate,
     current_user: dict = Depends(get_current_user)
@@ -145,18 +213,10 @@ async def create_content(
         )
     
     try:
-        content_dict = content.model_dump(exclude_none=True)
-        
-        # Add author if not provided
-        if not content_dict.get("author"):
-            content_dict["author"] = current_user.get("name", current_user.get("email", "Admin"))
-        
-        # Ensure images is a list if provided
-        if "images" in content_dict and content_dict["images"]:
-            if isinstance(content_dict["images"], str):
-                content_dict["images"] = [content_dict["images"]]
-        
-        return await ContentService.create_content(content_dict)
+        default_author = current_user.get("name", current_user.get("email", "Admin"))
+        created = await ContentService.create_content(content, default_author)
+        invalidate_sitemap_cache()
+        return created
     except Exception as e:
         logger.error(f"Error creating content: {str(e)}")
         raise HTTPException(
@@ -165,12 +225,44 @@ async def create_content(
         )
 
 
-@router.put("/{id}", response_model=ContentResponse)
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def bulk_create_contents(
+    items: list[ContentCreate],
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Seed multiple content items in one request (admin only)
+    """
+    if not current_user.get("is_admin", False):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can create articles"
+        )
+
+    try:
+        default_author = current_user.get("name", current_user.get("email", "Admin"))
+        created = await ContentService.bulk_create_contents(items, default_author)
+        invalidate_sitemap_cache()
+        return MongoJSONResponse({
+            "count": len(created),
+            "message": f"Created {len(created)} content items",
+            "items": created
+        })
+    except Exception as e:
+        logger.error(f"Error bulk creating contents: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to bulk create contents: {str(e)}"
+        )
+
+
+@router.put("/{id}", response_model=ContentResponse, response_model_by_alias=False)
 async def update_content(id: str, content: ContentUpdate):
     """Update existing content"""
     try:
-        update_dict = content.model_dump(exclude_none=True)
-        return await ContentService.update_content(id, update_dict)
+        updated = await ContentService.update_content(id, content)
+        invalidate_sitemap_cache()
+        return updated
     except InvalidObjectIDException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -198,6 +290,7 @@ async def delete_content(id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Content not found"
             )
+        invalidate_sitemap_cache()
     except InvalidObjectIDException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
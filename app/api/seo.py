@@ -3,74 +3,137 @@ SEO API endpoints
 Provides sitemap and robots.txt generation
 """
 from fastapi import APIRouter, Depends
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime
+from typing import Optional
+import time
+
 from ..core.database import get_content_collection, get_db
 from ..core.config import settings
+from ..utils import utcnow
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 router = APIRouter(prefix="/seo", tags=["SEO"])
 
+# Base URL is fixed at import time; use FRONTEND_URL from settings,
+# default to taxemployee.com
+BASE_URL = settings.FRONTEND_URL or "https://taxemployee.com"
+
+# Static pages - built once at import, only the lastmod date varies per request
+_STATIC_URLS_TEMPLATE = "\n".join([
+    f"  <url><loc>{BASE_URL}/</loc><lastmod>{{today}}</lastmod><changefreq>daily</changefreq><priority>1.0</priority></url>",
+    f"  <url><loc>{BASE_URL}/about-us</loc><lastmod>{{today}}</lastmod><changefreq>monthly</changefreq><priority>0.8</priority></url>",
+    f"  <url><loc>{BASE_URL}/income-tax</loc><lastmod>{{today}}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
+    f"  <url><loc>{BASE_URL}/gst</loc><lastmod>{{today}}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
+    f"  <url><loc>{BASE_URL}/mca</loc><lastmod>{{today}}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
+    f"  <url><loc>{BASE_URL}/sebi</loc><lastmod>{{today}}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
+    f"  <url><loc>{BASE_URL}/ms-office</loc><lastmod>{{today}}</lastmod><changefreq>weekly</changefreq><priority>0.7</priority></url>",
+])
+
+# Sitemap response cache - crawlers re-request far more often than content
+# changes, so serve a cached body and rebuild at most once per hour
+_SITEMAP_CACHE_TTL = 3600.0
+_sitemap_cache: Optional[tuple] = None  # (expires_at, body)
+
+_SITEMAP_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_SITEMAP_FOOTER = "\n</urlset>"
+
+# Fixed fragments of the per-article entry, hoisted out of the cursor loop
+_ARTICLE_PREFIX = f"\n  <url><loc>{BASE_URL}/article/"
+_ARTICLE_MIDDLE = "</loc><lastmod>"
+_ARTICLE_SUFFIX = "</lastmod><changefreq>weekly</changefreq><priority>0.7</priority></url>"
+
+
+def invalidate_sitemap_cache() -> None:
+    """Drop the cached sitemap body (called when content changes)"""
+    global _sitemap_cache
+    _sitemap_cache = None
+
 
 @router.get("/sitemap.xml")
 async def generate_sitemap(db: AsyncIOMotorDatabase = Depends(get_db)):
     """
     Generate dynamic sitemap.xml with all articles
     """
-    # Use FRONTEND_URL from settings, default to taxemployee.com
-    base_url = settings.FRONTEND_URL or "https://taxemployee.com"
-    
-    # Static pages
-    urls = [
-        f"  <url><loc>{base_url}/</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>daily</changefreq><priority>1.0</priority></url>",
-        f"  <url><loc>{base_url}/about-us</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>monthly</changefreq><priority>0.8</priority></url>",
-        f"  <url><loc>{base_url}/income-tax</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
-        f"  <url><loc>{base_url}/gst</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
-        f"  <url><loc>{base_url}/mca</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
-        f"  <url><loc>{base_url}/sebi</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>daily</changefreq><priority>0.9</priority></url>",
-        f"  <url><loc>{base_url}/ms-office</loc><lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod><changefreq>weekly</changefreq><priority>0.7</priority></url>",
-    ]
-    
-    # Dynamic article URLs
-    try:
-        collection = await get_content_collection()
-        cursor = collection.find({}).sort("date", -1)
-        
-        async for article in cursor:
-            article_id = str(article.get("_id", ""))
-            if article_id:
-                lastmod = article.get("date", datetime.now())
-                if isinstance(lastmod, datetime):
-                    lastmod_str = lastmod.strftime('%Y-%m-%d')
-                else:
-                    lastmod_str = datetime.now().strftime('%Y-%m-%d')
-                
-                urls.append(
-                    f"  <url><loc>{base_url}/article/{article_id}</loc><lastmod>{lastmod_str}</lastmod><changefreq>weekly</changefreq><priority>0.7</priority></url>"
-                )
-    except Exception as e:
-        pass  # Continue even if articles can't be fetched
-    
-    sitemap = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{chr(10).join(urls)}
-</urlset>"""
-    
-    return Response(content=sitemap, media_type="application/xml")
+    if _sitemap_cache is not None:
+        expires_at, body = _sitemap_cache
+        if time.monotonic() < expires_at:
+            return Response(content=body, media_type="application/xml")
 
+    # Compute today's date once for the whole sitemap
+    today = utcnow().strftime('%Y-%m-%d')
 
-@router.get("/robots.txt")
-async def get_robots():
-    """
-    Generate robots.txt
-    """
-    robots_content = f"""User-agent: *
+    async def generate():
+        """Yield the sitemap chunk by chunk as the cursor produces articles"""
+        global _sitemap_cache
+        parts = []
+
+        def emit(chunk: str) -> str:
+            parts.append(chunk)
+            return chunk
+
+        yield emit(_SITEMAP_HEADER)
+        yield emit(_STATIC_URLS_TEMPLATE.format(today=today))
+
+        # Dynamic article URLs
+        complete = False
+        try:
+            collection = await get_content_collection()
+            # Only _id and date are needed; the date index (init_indexes)
+            # makes the reverse sort an index walk
+            cursor = (
+                collection.find({}, {"_id": 1, "date": 1})
+                .sort("date", -1)
+                .batch_size(1000)
+            )
+
+            async for article in cursor:
+                article_id = str(article.get("_id", ""))
+                if article_id:
+                    lastmod = article.get("date")
+                    if isinstance(lastmod, datetime):
+                        lastmod_str = lastmod.strftime('%Y-%m-%d')
+                    else:
+                        lastmod_str = today
+
+                    yield emit(
+                        "".join((
+                            _ARTICLE_PREFIX, article_id,
+                            _ARTICLE_MIDDLE, lastmod_str,
+                            _ARTICLE_SUFFIX,
+                        ))
+                    )
+            complete = True
+        except Exception:
+            pass  # Continue even if articles can't be fetched
+
+        yield emit(_SITEMAP_FOOTER)
+        # Only cache sitemaps built from a clean article pass - a degraded
+        # body from a transient DB error must not be served for the TTL
+        if complete:
+            _sitemap_cache = (time.monotonic() + _SITEMAP_CACHE_TTL, "".join(parts))
+
+    return StreamingResponse(generate(), media_type="application/xml")
+
+
+# robots.txt never changes at runtime - build the response once at import
+_ROBOTS_RESPONSE = Response(
+    content=f"""User-agent: *
 Allow: /
 Disallow: /api/
 Disallow: /admin/
 Disallow: /submit-article
 Disallow: /login
 
-Sitemap: {base_url}/api/seo/sitemap.xml
-"""
-    return Response(content=robots_content, media_type="text/plain")
+Sitemap: {BASE_URL}/api/seo/sitemap.xml
+""".encode(),
+    media_type="text/plain"
+)
+
+
+@router.get("/robots.txt")
+async def get_robots():
+    """
+    Serve the precomputed robots.txt
+    """
+    return _ROBOTS_RESPONSE
@@ -5,9 +5,12 @@ Uses AWS S3 for cloud-based image storage
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status
 from fastapi.responses import JSONResponse
+import asyncio
+import base64
+import hashlib
 import os
 import logging
-from typing import List
+from typing import List, Tuple
 
 from ..api import auth
 from ..core.s3_config import upload_image_to_s3, is_s3_configured, delete_image_from_s3
@@ -18,6 +21,37 @@ router = APIRouter(prefix="/upload", tags=["Upload"])
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+READ_CHUNK_SIZE = 64 * 1024
+
+
+async def read_upload_limited(file: UploadFile) -> Tuple[bytes, str, str]:
+    """
+    Read an upload in chunks, aborting as soon as the size limit is exceeded
+    Computes SHA-256 and MD5 digests in the same pass over the data
+
+    Returns:
+        Tuple of (contents, sha256 hex digest, base64 MD5 digest for S3)
+    """
+    # Reject immediately when the client declared a size
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File size exceeds 5MB limit"
+        )
+
+    buffer = bytearray()
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5()
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File size exceeds 5MB limit"
+            )
+        sha256.update(chunk)
+        md5.update(chunk)
+    return bytes(buffer), sha256.hexdigest(), base64.b64encode(md5.digest()).decode()
 
 
 @router.post("/image")
@@ -51,19 +85,14 @@ async def upload_image(
             detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # Read file content
-    contents = await file.read()
-    
-    # Validate file size
-    if len(contents) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds 5MB limit"
-        )
-    
+    # Read file content with the size limit enforced during the read
+    contents, digest, content_md5 = await read_upload_limited(file)
+
     # Upload to S3
     try:
-        result = await upload_image_to_s3(contents, file.filename)
+        result = await upload_image_to_s3(
+            contents, file.filename, digest=digest, content_md5=content_md5
+        )
         
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -100,40 +129,50 @@ async def upload_multiple_images(
     
     uploaded_files = []
     errors = []
-    
-    for file in files:
+
+    # Cap concurrent S3 connections while letting uploads overlap
+    semaphore = asyncio.Semaphore(8)
+
+    async def process_file(file: UploadFile):
+        """Validate, read and upload a single file; returns (result, error)"""
         try:
             # Validate filename
             if not file.filename:
-                errors.append({"filename": "unknown", "error": "No filename provided"})
-                continue
-            
+                return None, {"filename": "unknown", "error": "No filename provided"}
+
             # Validate file extension
             file_ext = os.path.splitext(file.filename)[1].lower()
             if file_ext not in ALLOWED_EXTENSIONS:
-                errors.append({"filename": file.filename, "error": f"File type {file_ext} not allowed"})
-                continue
-            
-            # Read file content
-            contents = await file.read()
-            
-            # Validate file size
-            if len(contents) > MAX_FILE_SIZE:
-                errors.append({"filename": file.filename, "error": "File exceeds 5MB limit"})
-                continue
-            
+                return None, {"filename": file.filename, "error": f"File type {file_ext} not allowed"}
+
+            # Read file content with the size limit enforced during the read
+            try:
+                contents, digest, content_md5 = await read_upload_limited(file)
+            except HTTPException:
+                return None, {"filename": file.filename, "error": "File exceeds 5MB limit"}
+
             # Upload to S3
-            result = await upload_image_to_s3(contents, file.filename)
-            uploaded_files.append({
+            async with semaphore:
+                result = await upload_image_to_s3(
+                    contents, file.filename, digest=digest, content_md5=content_md5
+                )
+            return {
                 "url": result["url"],
                 "key": result["key"],
                 "filename": result["filename"],
                 "size": result["size"]
-            })
+            }, None
         except Exception as e:
             logger.error(f"Error uploading {file.filename}: {str(e)}")
-            errors.append({"filename": file.filename, "error": str(e)})
-    
+            return None, {"filename": file.filename, "error": str(e)}
+
+    results = await asyncio.gather(*(process_file(file) for file in files))
+    for result, error in results:
+        if result:
+            uploaded_files.append(result)
+        else:
+            errors.append(error)
+
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={
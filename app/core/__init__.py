@@ -1,11 +1,12 @@
 """Core package initialization"""
 
 from .config import settings
-from .database import init_db, close_db, get_db, ping_db, init_indexes
+from .database import init_db, close_db, get_db, ping_db, ping_db_cached, init_indexes
 from .database import get_content_collection, get_contact_collection
+from .responses import MongoJSONResponse
 from .s3_config import init_s3, is_s3_configured, upload_image_to_s3, delete_image_from_s3
 from .exceptions import (
-    Exception,
+    AppException,
     ValidationException,
     NotFoundException,
     ContentNotFoundException,
@@ -24,14 +25,16 @@ __all__ = [
     "close_db",
     "get_db",
     "ping_db",
+    "ping_db_cached",
     "init_indexes",
     "get_content_collection",
     "get_contact_collection",
+    "MongoJSONResponse",
     "init_s3",
     "is_s3_configured",
     "upload_image_to_s3",
     "delete_image_from_s3",
-    "Exception",
+    "AppException",
     "ValidationException",
     "NotFoundException",
     "ContentNotFoundException",
@@ -2,18 +2,24 @@
 Initialize Admin User from Environment Variables
 Automatically creates admin user on server startup if credentials are in .env
 """
+import asyncio
 import os
-import hashlib
 import logging
-from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from passlib.context import CryptContext
+
+from ..utils import utcnow
+
 logger = logging.getLogger(__name__)
 
+# Password hashing context (same scheme as auth.py)
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
 
 def hash_password(password: str) -> str:
-    """Hash password using SHA256 (same as auth.py)"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash password using argon2 (same as auth.py)"""
+    return pwd_context.hash(password)
 
 
 async def init_admin_user(db: AsyncIOMotorDatabase) -> bool:
@@ -33,19 +39,22 @@ async def init_admin_user(db: AsyncIOMotorDatabase) -> bool:
             return False
         
         users_collection = db.get_collection('users')
-        
+
+        # Hash once, off the event loop - argon2 is deliberately slow
+        hashed_password = await asyncio.to_thread(hash_password, admin_password)
+
         # Check if admin already exists
         existing = await users_collection.find_one({'email': admin_email})
-        
+
         if existing:
             # Update existing user to ensure it's admin
             await users_collection.update_one(
                 {'_id': existing['_id']},
                 {'$set': {
                     'is_admin': True,
-                    'password': hash_password(admin_password),
+                    'password': hashed_password,
                     'name': admin_name,
-                    'updated_at': datetime.utcnow(),
+                    'updated_at': utcnow(),
                     'roles': ['admin']
                 }}
             )
@@ -55,15 +64,14 @@ async def init_admin_user(db: AsyncIOMotorDatabase) -> bool:
             user = {
                 'email': admin_email,
                 'name': admin_name,
-                'password': hash_password(admin_password),
+                'password': hashed_password,
                 'is_admin': True,
-                'created_at': datetime.utcnow(),
+                'created_at': utcnow(),
                 'roles': ['admin']
             }
             result = await users_collection.insert_one(user)
             logger.info(f"✅ Created admin user: {admin_email} (ID: {result.inserted_id})")
         
-        logger.info(f"📋 Admin credentials: {admin_email} / {admin_password}")
         return True
         
     except Exception as e:
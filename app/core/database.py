@@ -3,9 +3,15 @@ Database initialization and connection management
 Handles MongoDB async connections and indexing
 """
 
+import asyncio
 import motor.motor_asyncio
 import logging
+import time
 from typing import Optional
+
+from pymongo import IndexModel
+from pymongo.errors import PyMongoError
+
 from .config import settings
 
 logger = logging.getLogger(__name__)
@@ -14,11 +20,16 @@ logger = logging.getLogger(__name__)
 _client: Optional[motor.motor_asyncio.AsyncIOMotorClient] = None
 _database: Optional[motor.motor_asyncio.AsyncIOMotorDatabase] = None
 
+# Collection handles are stable once the connection exists - cache them
+# so per-request dependencies are a plain attribute return
+_content_collection = None
+_contact_collection = None
+
 
 async def init_db() -> None:
     """Initialize database connection"""
-    global _client, _database
-    
+    global _client, _database, _content_collection, _contact_collection
+
     try:
         logger.info(f"Attempting to connect to MongoDB: {settings.MONGO_URL[:50]}...")
         
@@ -33,11 +44,17 @@ async def init_db() -> None:
             socketTimeoutMS=60000,
             maxIdleTimeMS=45000,
             retryWrites=True,
-            maxPoolSize=50,
-            minPoolSize=10,
+            # Grow on demand up to 200 connections; no warm minimum so idle
+            # deployments don't pay handshake cost. Wire compression cuts
+            # BSON bytes several-fold for the text-heavy article bodies.
+            maxPoolSize=200,
+            minPoolSize=0,
+            compressors="zstd,snappy",
         )
         _database = _client[settings.DATABASE_NAME]
-        
+        _content_collection = _database.get_collection("contents")
+        _contact_collection = _database.get_collection("contacts")
+
         # Verify connection - use async/await properly
         logger.info("Verifying MongoDB connection...")
         await _database.command('ping')
@@ -45,7 +62,7 @@ async def init_db() -> None:
         
         # Initialize indexes
         await init_indexes()
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Failed to initialize database: {str(e)}")
         logger.error(f"MongoDB URL: {settings.MONGO_URL[:100]}")
         raise
@@ -59,7 +76,7 @@ async def close_db() -> None:
         if _client:
             _client.close()
             logger.info("Database connection closed")
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Error closing database: {str(e)}")
 
 
@@ -82,11 +99,36 @@ async def ping_db() -> bool:
             await _database.command('ping')
             return True
         return False
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Database ping failed: {str(e)}")
         return False
 
 
+# Last ping result - health checkers hit / and /health far more often
+# than the connection state can meaningfully change
+_last_ping: Optional[tuple] = None  # (timestamp, result)
+
+
+async def ping_db_cached(ttl: float = 2.0) -> bool:
+    """
+    Ping the database, reusing a recent result to avoid a round-trip
+    per health-check request
+
+    Args:
+        ttl: Maximum age in seconds of a reusable ping result
+
+    Returns:
+        bool: True if connected, False otherwise
+    """
+    global _last_ping
+    now = time.monotonic()
+    if _last_ping is not None and now - _last_ping[0] < ttl:
+        return _last_ping[1]
+    result = await ping_db()
+    _last_ping = (now, result)
+    return result
+
+
 async def init_indexes() -> None:
     """
     Initialize database indexes for better query performance
@@ -100,35 +142,51 @@ async def init_indexes() -> None:
         # Get collections
         content_collection = _database.get_collection("contents")
         contact_collection = _database.get_collection("contacts")
-        
-        # Content collection indexes
-        await content_collection.create_index([("category", 1)])
-        await content_collection.create_index([("type", 1)])
-        await content_collection.create_index([("date", -1)])
-        await content_collection.create_index([
-            ("title", "text"),
-            ("body", "text"),
-            ("summary", "text")
-        ])
-        
-        # Contact collection indexes
-        await contact_collection.create_index([("email", 1)])
-        await contact_collection.create_index([("date", -1)])
-        await contact_collection.create_index([("status", 1)])
+        users_collection = _database.get_collection("users")
+
+        # One createIndexes command per collection, sent concurrently,
+        # instead of a network round-trip per index
+        await asyncio.gather(
+            # Users collection indexes (token lookup on every authenticated request)
+            users_collection.create_indexes([
+                IndexModel([("token_hash", 1)], unique=True, sparse=True),
+            ]),
+            # Content collection indexes - compounds match the list query
+            # shapes ({category,type} and {category} sorted by date desc)
+            # so pages come from index range scans with no in-memory sort
+            content_collection.create_indexes([
+                IndexModel([("category", 1), ("type", 1), ("date", -1)]),
+                IndexModel([("category", 1), ("date", -1)]),
+                IndexModel([("date", -1)]),
+                IndexModel([
+                    ("title", "text"),
+                    ("body", "text"),
+                    ("summary", "text")
+                ]),
+            ]),
+            # Contact collection indexes
+            contact_collection.create_indexes([
+                IndexModel([("email", 1)]),
+                IndexModel([("date", -1)]),
+                IndexModel([("status", 1)]),
+            ]),
+        )
         
         logger.info("Database indexes created successfully")
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Error creating indexes: {str(e)}")
 
 
 # Dependency for getting database collections
 async def get_content_collection():
     """Get content collection"""
-    db = await get_db()
-    return db.get_collection("contents")
+    if _content_collection is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _content_collection
 
 
 async def get_contact_collection():
     """Get contact collection"""
-    db = await get_db()
-    return db.get_collection("contacts")
+    if _contact_collection is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _contact_collection
@@ -0,0 +1,16 @@
+"""
+Single point of .env loading for the application
+Importing this module anywhere guarantees the file is parsed exactly once
+"""
+
+import os.path
+
+from dotenv import load_dotenv
+
+# Ensure we load the project's .env (backend/.env) explicitly
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DOTENV_PATH = os.path.join(BASE_DIR, '.env')
+
+load_dotenv(dotenv_path=DOTENV_PATH, override=False)
+
+_LOADED = True
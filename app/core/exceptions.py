@@ -6,8 +6,8 @@ Provides typed exceptions with proper HTTP status codes
 from fastapi import HTTPException, status
 
 
-class Exception(Exception):
-    """Base exception for """
+class AppException(Exception):
+    """Base application exception"""
     
     def __init__(self, message: str, status_code: int = 500):
         self.message = message
@@ -15,14 +15,14 @@ class Exception(Exception):
         super().__init__(self.message)
 
 
-class ValidationException(Exception):
+class ValidationException(AppException):
     """Raised when data validation fails"""
     
     def __init__(self, message: str):
         super().__init__(message, status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 
-class NotFoundException(Exception):
+class NotFoundException(AppException):
     """Raised when a resource is not found"""
     
     def __init__(self, message: str = "Resource not found"):
@@ -50,7 +50,7 @@ class InvalidObjectIDException(ValidationException):
         super().__init__(message)
 
 
-class DatabaseException(Exception):
+class DatabaseException(AppException):
     """Raised when database operation fails"""
     
     def __init__(self, message: str = "Database operation failed"):
@@ -64,20 +64,20 @@ class DuplicateEntryException(ValidationException):
         super().__init__(message)
 
 
-class UnauthorizedException(Exception):
+class UnauthorizedException(AppException):
     """Raised when user is unauthorized"""
     
     def __init__(self, message: str = "Unauthorized"):
         super().__init__(message, status.HTTP_401_UNAUTHORIZED)
 
 
-class ForbiddenException(Exception):
+class ForbiddenException(AppException):
     """Raised when user lacks permissions"""
     
     def __init__(self, message: str = "Forbidden"):
         super().__init__(message, status.HTTP_403_FORBIDDEN)
 
 
-def to_http_exception(exc: Exception) -> HTTPException:
-    """Convert Exception to HTTPException"""
+def to_http_exception(exc: AppException) -> HTTPException:
+    """Convert AppException to HTTPException"""
     return HTTPException(status_code=exc.status_code, detail=exc.message)
@@ -0,0 +1,51 @@
+"""
+Custom response classes
+orjson-based rendering that understands Motor/BSON document types
+"""
+
+from enum import Enum
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(value):
+    """Fallback encoder for types orjson doesn't handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class MongoJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+    Serializes Motor documents directly (ObjectId, datetime, Enum),
+    bypassing FastAPI's jsonable_encoder pass
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response for an already-validated Pydantic model
+    Invokes the model's compiled serializer directly, skipping the
+    response_model re-validation FastAPI would otherwise perform
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return content.__pydantic_serializer__.to_json(
+            content, by_alias=False, exclude_none=True
+        )
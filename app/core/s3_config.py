@@ -3,151 +3,250 @@ AWS S3 configuration for image storage
 Handles cloud-based image storage and CDN delivery via AWS S3
 """
 
-import boto3
+import aioboto3
+from aiobotocore.config import AioConfig
+from botocore.exceptions import BotoCoreError, ClientError
 import os
 import logging
+import time
 import uuid
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from datetime import datetime
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
+# The .env file is loaded once via app.core.env
+from . import env  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-# AWS S3 configuration
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-AWS_S3_BUCKET_NAME = os.getenv("AWS_S3_BUCKET_NAME", "")
-AWS_S3_REGION = os.getenv("AWS_S3_REGION", "us-east-1")
-AWS_S3_CUSTOM_DOMAIN = os.getenv("AWS_S3_CUSTOM_DOMAIN", "")  # Optional CloudFront or custom domain
 
-# S3 client
+@dataclass(frozen=True, slots=True)
+class S3Config:
+    """AWS S3 configuration - immutable snapshot of the environment"""
+
+    access_key: str
+    secret_key: str
+    bucket: str
+    region: str
+    custom_domain: str  # Optional CloudFront or custom domain
+
+    @property
+    def configured(self) -> bool:
+        """Whether credentials and bucket are all present"""
+        return bool(self.access_key and self.secret_key and self.bucket)
+
+
+@lru_cache(maxsize=1)
+def get_s3_config() -> S3Config:
+    """Read the S3 configuration from the environment once per process"""
+    return S3Config(
+        access_key=os.getenv("AWS_ACCESS_KEY_ID", ""),
+        secret_key=os.getenv("AWS_SECRET_ACCESS_KEY", ""),
+        bucket=os.getenv("AWS_S3_BUCKET_NAME", ""),
+        region=os.getenv("AWS_S3_REGION", "us-east-1"),
+        custom_domain=os.getenv("AWS_S3_CUSTOM_DOMAIN", ""),
+    )
+
+# Long-lived async S3 client - entered once at startup and kept open so
+# uploads reuse the connection pool instead of re-doing TLS handshakes
 s3_client = None
+_client_stack = None
+
+# Content types by extension - one dict lookup per upload instead of a
+# chain of lower()/endswith scans
+_EXT_CONTENT_TYPES = {
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
 
 
-def init_s3():
-    """Initialize S3 client"""
-    global s3_client
-    
-    if not all([AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_S3_BUCKET_NAME]):
+async def init_s3():
+    """Initialize the async S3 client"""
+    global s3_client, _client_stack
+
+    config = get_s3_config()
+    if not config.configured:
         logger.warning(
             "AWS S3 credentials not fully configured. "
             "Image uploads will be disabled."
         )
         return False
-    
+
     try:
-        s3_client = boto3.client(
-            "s3",
-            region_name=AWS_S3_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+        session = aioboto3.Session()
+        stack = AsyncExitStack()
+        client = await stack.enter_async_context(
+            session.client(
+                "s3",
+                region_name=config.region,
+                aws_access_key_id=config.access_key,
+                aws_secret_access_key=config.secret_key,
+                # Wider connection pool for concurrent uploads; keepalive
+                # avoids a TLS handshake per request and adaptive retries
+                # back off under throttling instead of retry-storming
+                config=AioConfig(
+                    max_pool_connections=50,
+                    tcp_keepalive=True,
+                    retries={"max_attempts": 3, "mode": "adaptive"}
+                )
+            )
         )
-        
+
         # Test connection by listing buckets
-        s3_client.list_buckets()
+        await client.list_buckets()
+        s3_client = client
+        _client_stack = stack
         logger.info("S3 client initialized successfully")
         return True
-    except Exception as e:
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Failed to initialize S3 client: {str(e)}")
         return False
 
 
+async def close_s3():
+    """Close the async S3 client"""
+    global s3_client, _client_stack
+
+    try:
+        if _client_stack is not None:
+            await _client_stack.aclose()
+            logger.info("S3 client closed")
+    except (BotoCoreError, ClientError) as e:
+        logger.error(f"Error closing S3 client: {str(e)}")
+    finally:
+        s3_client = None
+        _client_stack = None
+
+
 def generate_s3_key(filename: str, folder: str = "") -> str:
     """
     Generate a unique S3 key for the file
-    
+
     Args:
         filename: Original filename
         folder: S3 folder prefix
-    
+
     Returns:
         str: Unique S3 key path
     """
     # Get file extension
     _, ext = os.path.splitext(filename)
-    
-    # Generate unique filename
+
+    # Generate unique filename - time.strftime formats straight from the
+    # C struct without building a datetime object per upload
     unique_id = uuid.uuid4().hex[:8]
-    timestamp = datetime.utcnow().strftime("%Y%m%d")
+    timestamp = time.strftime("%Y%m%d", time.gmtime())
     s3_key = f"{folder}/{timestamp}/{unique_id}{ext}"
-    
+
     return s3_key
 
 
-async def upload_image_to_s3(file_data: bytes, filename: str, folder: str = "") -> dict:
+def _build_object_url(s3_key: str) -> str:
+    """Build the public URL for an S3 object key"""
+    config = get_s3_config()
+    if config.custom_domain:
+        # Use custom domain (CloudFront or custom domain)
+        return f"https://{config.custom_domain}/{s3_key}"
+    # Use S3 default URL
+    return f"https://{config.bucket}.s3.{config.region}.amazonaws.com/{s3_key}"
+
+
+async def _object_exists(s3_key: str) -> bool:
+    """Check whether an object already exists in the bucket"""
+    try:
+        await s3_client.head_object(Bucket=get_s3_config().bucket, Key=s3_key)
+        return True
+    except ClientError:
+        return False
+
+
+async def upload_image_to_s3(
+    file_data: bytes,
+    filename: str,
+    folder: str = "",
+    digest: str = None,
+    content_md5: str = None
+) -> dict:
     """
     Upload image to AWS S3
-    Uses asyncio executor to run blocking boto3 operations
-    
+    Awaits the async S3 client directly on the event loop
+
     Args:
         file_data: Binary file data
         filename: Original filename
         folder: S3 folder prefix
-    
+        digest: Optional precomputed SHA-256 hex digest of the data
+        content_md5: Optional precomputed base64 MD5 digest for S3
+
     Returns:
         dict: Upload response with url and key
-    
+
     Raises:
         Exception: If upload fails
     """
     if not is_s3_configured():
         raise Exception("S3 is not configured")
-    
-    # Ensure S3 client is initialized
+
+    # Client is initialized once in lifespan - never from the request path
     if s3_client is None:
-        if not init_s3():
-            raise Exception("S3 client initialization failed")
-    
-    import asyncio
-    
+        raise Exception("S3 client not initialized")
+
     try:
-        # Generate S3 key
-        s3_key = generate_s3_key(filename, folder)
-        
-        # Determine content type
-        content_type = "image/jpeg"
-        if filename.lower().endswith(".png"):
-            content_type = "image/png"
-        elif filename.lower().endswith(".gif"):
-            content_type = "image/gif"
-        elif filename.lower().endswith(".webp"):
-            content_type = "image/webp"
-        
-        # Run blocking boto3 operation in executor
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: s3_client.put_object(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Key=s3_key,
-                Body=file_data,
-                ContentType=content_type,
-                ServerSideEncryption="AES256",
-                Metadata={
-                    "original-filename": filename,
-                    "uploaded-at": datetime.utcnow().isoformat()
+        # Content-addressed key when the digest is known: identical bytes
+        # map to the same object, so re-uploads become a HeadObject no-op
+        if digest:
+            _, ext = os.path.splitext(filename)
+            s3_key = f"{folder}/{digest[:2]}/{digest}{ext}"
+            if await _object_exists(s3_key):
+                logger.info(f"Skipping upload of {filename}; object already in S3: {s3_key}")
+                return {
+                    "url": _build_object_url(s3_key),
+                    "key": s3_key,
+                    "filename": filename,
+                    "size": len(file_data),
                 }
-            )
-        )
-        
-        # Generate URL
-        if AWS_S3_CUSTOM_DOMAIN:
-            # Use custom domain (CloudFront or custom domain)
-            url = f"https://{AWS_S3_CUSTOM_DOMAIN}/{s3_key}"
         else:
-            # Use S3 default URL
-            url = f"https://{AWS_S3_BUCKET_NAME}.s3.{AWS_S3_REGION}.amazonaws.com/{s3_key}"
-        
+            s3_key = generate_s3_key(filename, folder)
+
+        # Determine content type
+        content_type = _EXT_CONTENT_TYPES.get(
+            os.path.splitext(filename)[1].lower(), "image/jpeg"
+        )
+
+        # Pass precomputed digests so the client skips re-hashing the body
+        put_kwargs = {
+            "Bucket": get_s3_config().bucket,
+            "Key": s3_key,
+            "Body": file_data,
+            "ContentType": content_type,
+            "ServerSideEncryption": "AES256",
+            "Metadata": {
+                "original-filename": filename,
+                "uploaded-at": datetime.utcnow().isoformat()
+            }
+        }
+        if content_md5:
+            put_kwargs["ContentMD5"] = content_md5
+        if digest:
+            put_kwargs["Metadata"]["sha256"] = digest
+
+        await s3_client.put_object(**put_kwargs)
+
+        url = _build_object_url(s3_key)
+
         logger.info(f"Successfully uploaded {filename} to S3: {s3_key}")
-        
+
         return {
             "url": url,
             "key": s3_key,
             "filename": filename,
             "size": len(file_data),
         }
-    except Exception as e:
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error uploading image to S3: {str(e)}")
         raise
 
@@ -155,54 +254,39 @@ async def upload_image_to_s3(file_data: bytes, filename: str, folder: str = "")
 async def delete_image_from_s3(s3_key: str) -> bool:
     """
     Delete image from S3
-    Uses asyncio executor to run blocking boto3 operations
-    
+    Awaits the async S3 client directly on the event loop
+
     Args:
         s3_key: S3 object key
-    
+
     Returns:
         bool: True if deleted, False otherwise
     """
     if not is_s3_configured():
         return False
-    
-    # Ensure S3 client is initialized
+
+    # Client is initialized once in lifespan - never from the request path
     if s3_client is None:
-        if not init_s3():
-            logger.error("S3 client initialization failed")
-            return False
-    
-    import asyncio
-    
+        logger.error("S3 client not initialized")
+        return False
+
     try:
-        # Run blocking boto3 operation in executor
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: s3_client.delete_object(
-                Bucket=AWS_S3_BUCKET_NAME,
-                Key=s3_key
-            )
+        await s3_client.delete_object(
+            Bucket=get_s3_config().bucket,
+            Key=s3_key
         )
         logger.info(f"Successfully deleted image from S3: {s3_key}")
         return True
-    except Exception as e:
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error deleting image from S3: {str(e)}")
         return False
 
 
 def is_s3_configured() -> bool:
     """Check if S3 is properly configured"""
-    return bool(
-        AWS_ACCESS_KEY_ID 
-        and AWS_SECRET_ACCESS_KEY 
-        and AWS_S3_BUCKET_NAME
-    )
+    return get_s3_config().configured
 
 
 def get_s3_client():
     """Get S3 client instance"""
-    global s3_client
-    if s3_client is None:
-        init_s3()
     return s3_client
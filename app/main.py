@@ -6,15 +6,16 @@ Main application entry point with middleware, routes, and error handling
 import logging
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 import os
 
-from .core import settings, init_db, close_db, ping_db
+from .core import settings, init_db, close_db, ping_db_cached
 from .core.database import get_db
-from .core.s3_config import init_s3
+from .core.s3_config import init_s3, close_s3
 from .core.admin_init import init_admin_user
 from .api import content, contact, auth, upload, seo
 
@@ -41,7 +42,7 @@ async def lifespan(app: FastAPI):
         await init_admin_user(db)
         
         # Initialize S3 for image storage
-        init_s3()
+        await init_s3()
         logger.info("S3 storage initialized")
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
@@ -52,6 +53,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down  API...")
     try:
+        await close_s3()
         await close_db()
         logger.info("Database connection closed")
     except Exception as e:
@@ -63,7 +65,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -79,14 +82,23 @@ app.add_middleware(
 )
 
 
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests"""
-    logger.debug(f"{request.method} {request.url.path}")
-    response = await call_next(request)
-    logger.debug(f"Response status: {response.status_code}")
-    return response
+# Request logging middleware - only installed in debug mode so production
+# requests don't pay an extra ASGI hop (uvicorn access logs cover prod)
+def _install_debug_middleware(app: FastAPI) -> None:
+    """Register the request logging middleware"""
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        """Log all incoming requests"""
+        # Deferred %-formatting - no string is built unless DEBUG is enabled
+        logger.debug("%s %s", request.method, request.url.path)
+        response = await call_next(request)
+        logger.debug("Response status: %s", response.status_code)
+        return response
+
+
+if settings.DEBUG:
+    _install_debug_middleware(app)
 
 
 # Global exception handler
@@ -144,7 +156,7 @@ async def read_root():
     Returns:
         API metadata and available endpoints
     """
-    db_status = await ping_db()
+    db_status = await ping_db_cached()
     
     return {
         "message": "Welcome to  API",
@@ -171,7 +183,7 @@ async def health_check():
     Returns:
         Application and database health status
     """
-    db_status = await ping_db()
+    db_status = await ping_db_cached()
     
     return {
         "status": "healthy" if db_status else "degraded",
@@ -180,16 +192,9 @@ async def health_check():
     }
 
 
-# Navigation menus endpoint
-@app.get("/menus")
-async def get_menus():
-    """
-    Get navigation menu structure for frontend
-    
-    Returns:
-        Menu structure with categories and subcategories
-    """
-    return {
+# Navigation menu structure is static - build the payload once at import
+# time instead of reallocating the nested dicts on every request
+_MENUS_PAYLOAD = {
         "main_menus": [
             {
                 "id": "home",
@@ -258,7 +263,22 @@ async def get_menus():
                 "description": "About our portal"
             }
         ]
-    }
+}
+
+# Serialize once - the payload never changes, so every hit returns cached bytes
+_MENUS_BYTES = orjson.dumps(_MENUS_PAYLOAD)
+
+
+# Navigation menus endpoint
+@app.get("/menus")
+async def get_menus():
+    """
+    Get navigation menu structure for frontend
+
+    Returns:
+        Menu structure with categories and subcategories
+    """
+    return Response(content=_MENUS_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
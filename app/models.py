@@ -2,39 +2,44 @@
 Pydantic models for  API
 """
 
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional
 from bson import ObjectId
 
 
-class PyObjectId(ObjectId):
-    """Custom ObjectId type for Pydantic"""
-    
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+def _validate_object_id(v):
+    """Accept ObjectId instances or valid ObjectId strings, normalized to str"""
+    # Documents read from the DB already carry ObjectId instances -
+    # stringify them directly instead of re-validating
+    if isinstance(v, ObjectId):
+        return str(v)
+    if isinstance(v, str) and ObjectId.is_valid(v):
+        return v
+    raise ValueError("Invalid objectid")
+
 
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid objectid")
-        return ObjectId(v)
+# ObjectId type for Pydantic - a plain str field with a pre-validator,
+# so pydantic-core handles it natively instead of via v1 compatibility shims
+PyObjectId = Annotated[str, BeforeValidator(_validate_object_id)]
 
-    @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
+# Allowed content values - pydantic-core checks Literal membership natively,
+# replacing the Python-level field validators previously run per model
+ContentTypeLiteral = Literal['articles', 'news', 'judiciary', 'others']
+ContentCategoryLiteral = Literal['income-tax', 'gst', 'mca', 'sebi', 'ms-office']
 
 
 class ContentModel(BaseModel):
     """Content model for API responses"""
-    id: Optional[str] = Field(default=None, alias="_id")
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
     title: str = Field(..., min_length=1, max_length=500)
-    type: str = Field(..., description="Type: articles, news, judiciary, or others")
-    category: str = Field(..., description="Category: income-tax, gst, mca, sebi, or ms-office")
+    type: ContentTypeLiteral = Field(..., description="Type: articles, news, judiciary, or others")
+    category: ContentCategoryLiteral = Field(..., description="Category: income-tax, gst, mca, sebi, or ms-office")
     body: str = Field(..., min_length=10)
     summary: Optional[str] = Field(None, max_length=500)
-    date: Optional[datetime] = Field(default_factory=datetime.now)
+    # No clock read per constructed model - the create path stamps the
+    # date once at insert time (see ContentService.create_content)
+    date: Optional[datetime] = None
 
     class Config:
         populate_by_name = True
@@ -51,47 +56,15 @@ class ContentModel(BaseModel):
             }
         }
 
-    @field_validator('type')
-    @classmethod
-    def validate_type(cls, v):
-        allowed_types = ['articles', 'news', 'judiciary', 'others']
-        if v not in allowed_types:
-            raise ValueError(f'Type must be one of {allowed_types}')
-        return v
-
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v):
-        allowed_categories = ['income-tax', 'gst', 'mca', 'sebi', 'ms-office']
-        if v not in allowed_categories:
-            raise ValueError(f'Category must be one of {allowed_categories}')
-        return v
-
 
 class CreateContentSchema(BaseModel):
     """Schema for creating content"""
     title: str = Field(..., min_length=1, max_length=500)
-    type: str
-    category: str
+    type: ContentTypeLiteral
+    category: ContentCategoryLiteral
     body: str = Field(..., min_length=10)
     summary: Optional[str] = Field(None, max_length=500)
 
-    @field_validator('type')
-    @classmethod
-    def validate_type(cls, v):
-        allowed_types = ['articles', 'news', 'judiciary', 'others']
-        if v not in allowed_types:
-            raise ValueError(f'Type must be one of {allowed_types}')
-        return v
-
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v):
-        allowed_categories = ['income-tax', 'gst', 'mca', 'sebi', 'ms-office']
-        if v not in allowed_categories:
-            raise ValueError(f'Category must be one of {allowed_categories}')
-        return v
-
 
 class UpdateContentSchema(BaseModel):
     """Schema for updating content"""
@@ -7,7 +7,12 @@ from pydantic import BaseModel, EmailStr, Field
 
 class LoginRequest(BaseModel):
     """Login request schema"""
-    email: EmailStr = Field(..., description="User email")
+    # Lightweight pattern check instead of EmailStr - login runs on every
+    # session refresh and full email validation is pure Python; creation
+    # (UserCreate) keeps the strict EmailStr
+    email: str = Field(
+        ..., pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", description="User email"
+    )
     password: str = Field(..., min_length=6, description="User password")
 
 
@@ -3,9 +3,9 @@ Contact data models and schemas
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field, EmailStr, field_validator, ConfigDict
-from typing import Optional, List
-from datetime import datetime
+from pydantic import BaseModel, Field, EmailStr, StringConstraints, ConfigDict
+from typing import Annotated, Optional, List
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -17,35 +17,17 @@ class ContactStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+# Strip + length constraints run inside pydantic-core, replacing the
+# Python-level field validators previously invoked per request
+Name = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+Message = Annotated[str, StringConstraints(strip_whitespace=True, min_length=10, max_length=5000)]
+
+
 class ContactBase(BaseModel):
     """Base contact model"""
-    name: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Contact name"
-    )
+    name: Name = Field(..., description="Contact name")
     email: EmailStr = Field(..., description="Contact email")
-    message: str = Field(
-        ...,
-        min_length=10,
-        max_length=5000,
-        description="Contact message"
-    )
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Name cannot be empty')
-        return v.strip()
-    
-    @field_validator('message')
-    @classmethod
-    def validate_message(cls, v):
-        if not v or len(v.strip()) < 10:
-            raise ValueError('Message must be at least 10 characters')
-        return v.strip()
+    message: Message = Field(..., description="Contact message")
 
 
 class ContactCreate(ContactBase):
@@ -57,7 +39,7 @@ class ContactResponse(ContactBase):
     """Schema for contact response"""
     id: Optional[str] = Field(None, alias="_id")
     status: ContactStatus = Field(default=ContactStatus.NEW)
-    date: datetime = Field(default_factory=datetime.utcnow)
+    date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
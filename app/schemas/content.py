@@ -3,8 +3,8 @@ Content data models and schemas
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List
+from pydantic import BaseModel, Field, StringConstraints, ConfigDict, field_validator
+from typing import Annotated, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -26,21 +26,18 @@ class ContentCategory(str, Enum):
     MS_OFFICE = "ms-office"
 
 
+# Strip + length constraints run inside pydantic-core, replacing the
+# Python-level field validators previously invoked per request
+Title = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+Body = Annotated[str, StringConstraints(strip_whitespace=True, min_length=10)]
+
+
 class ContentBase(BaseModel):
     """Base content model"""
-    title: str = Field(
-        ...,
-        min_length=1,
-        max_length=500,
-        description="Content title"
-    )
+    title: Title = Field(..., description="Content title")
     type: ContentType = Field(..., description="Content type")
     category: ContentCategory = Field(..., description="Content category")
-    body: str = Field(
-        ...,
-        min_length=10,
-        description="Content body"
-    )
+    body: Body = Field(..., description="Content body")
     summary: Optional[str] = Field(
         None,
         max_length=500,
@@ -55,20 +52,6 @@ class ContentBase(BaseModel):
         None,
         description="List of image URLs"
     )
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Title cannot be empty')
-        return v.strip()
-    
-    @field_validator('body')
-    @classmethod
-    def validate_body(cls, v):
-        if not v or len(v.strip()) < 10:
-            raise ValueError('Body must be at least 10 characters')
-        return v.strip()
 
 
 class ContentCreate(ContentBase):
@@ -89,13 +72,23 @@ class ContentUpdate(BaseModel):
     body: Optional[str] = Field(None, min_length=10, description="Content body")
     summary: Optional[str] = Field(None, max_length=500, description="Content summary")
     
+    @field_validator('title', 'type', 'category', 'body')
+    @classmethod
+    def reject_explicit_null(cls, v):
+        """These fields are required on stored documents - an explicit null
+        would unset them; only omitting the field is allowed"""
+        if v is None:
+            raise ValueError('Field cannot be set to null; omit it instead')
+        return v
+    
     model_config = ConfigDict(from_attributes=True)
 
 
 class ContentResponse(ContentBase):
     """Schema for content response"""
     id: Optional[str] = Field(None, alias="_id")
-    date: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    # Responses carry the stored date; no clock read per constructed model
+    date: Optional[datetime] = None
     author: Optional[str] = None
     images: Optional[List[str]] = None
     
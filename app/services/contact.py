@@ -3,43 +3,52 @@ Contact Service
 Handles all business logic for contact submissions
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
-from bson import ObjectId
-from datetime import datetime
+from pymongo import ReturnDocument
 import logging
 
 from ..core import get_contact_collection, InvalidObjectIDException, ContactNotFoundException, DatabaseException
-from ..utils import is_valid_object_id, format_contact_response, create_list_response
+from ..schemas import ContactCreate
+from ..utils import to_oid, utcnow, format_contact_response, create_list_response
 
 logger = logging.getLogger(__name__)
 
+# The admin list view shows sender and status - the message body is
+# fetched per item, so skip it in list queries
+_LIST_PROJECTION = {"message": 0}
+
 
 class ContactService:
     """Service for managing contact submissions"""
     
     @staticmethod
-    async def create_contact(contact_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_contact(contact: ContactCreate) -> Dict[str, Any]:
         """
         Create a new contact submission
-        
+
         Args:
-            contact_data: Contact form data
-            
+            contact: Validated contact form data
+
         Returns:
             Created contact document
         """
         try:
             collection = await get_contact_collection()
-            
-            # Add metadata
-            contact_data["date"] = datetime.utcnow()
+
+            # Serialize once, at the insert boundary
+            contact_data = contact.model_dump(exclude_none=True)
+
+            # Add metadata - one clock read for both timestamps
+            now = utcnow()
+            contact_data["date"] = now
             contact_data["status"] = "new"
-            contact_data["created_at"] = datetime.utcnow()
-            
-            result = await collection.insert_one(contact_data)
-            created = await collection.find_one({"_id": result.inserted_id})
+            contact_data["created_at"] = now
             
-            return format_contact_response(created)
+            # insert_one fills in _id on the dict - no refetch needed
+            await collection.insert_one(contact_data)
+
+            return format_contact_response(contact_data)
             
         except Exception as e:
             logger.error(f"Error creating contact: {str(e)}")
@@ -60,13 +69,17 @@ class ContactService:
         try:
             collection = await get_contact_collection()
             
-            total = await collection.count_documents({})
-            
-            cursor = collection.find({}).skip(skip).limit(limit).sort("date", -1)
-            items = []
-            async for document in cursor:
-                items.append(format_contact_response(document))
-            
+            # Count and page fetch run concurrently - independent round-trips
+            cursor = (
+                collection.find({}, _LIST_PROJECTION)
+                .skip(skip).limit(limit).sort("date", -1).batch_size(limit)
+            )
+            total, docs = await asyncio.gather(
+                collection.count_documents({}),
+                cursor.to_list(length=limit)
+            )
+            items = [format_contact_response(d) for d in docs]
+
             return create_list_response(items, total, skip, limit)
             
         except Exception as e:
@@ -89,11 +102,10 @@ class ContactService:
             ContactNotFoundException: If contact not found
         """
         try:
-            if not is_valid_object_id(id):
-                raise InvalidObjectIDException(f"Invalid contact ID format: {id}")
-            
+            oid = to_oid(id)
+
             collection = await get_contact_collection()
-            document = await collection.find_one({"_id": ObjectId(id)})
+            document = await collection.find_one({"_id": oid})
             
             if not document:
                 raise ContactNotFoundException(f"Contact not found with ID: {id}")
@@ -119,12 +131,13 @@ class ContactService:
         """
         try:
             collection = await get_contact_collection()
-            
-            query = {}
+
             if status:
-                query["status"] = status
-            
-            return await collection.count_documents(query)
+                return await collection.count_documents({"status": status})
+
+            # Unfiltered count comes straight from collection metadata -
+            # no document scan
+            return await collection.estimated_document_count()
             
         except Exception as e:
             logger.error(f"Error counting contacts: {str(e)}")
@@ -147,29 +160,24 @@ class ContactService:
             ContactNotFoundException: If contact not found
         """
         try:
-            if not is_valid_object_id(id):
-                raise InvalidObjectIDException(f"Invalid contact ID format: {id}")
-            
+            oid = to_oid(id)
+
             collection = await get_contact_collection()
-            
-            # Check if exists
-            existing = await collection.find_one({"_id": ObjectId(id)})
-            if not existing:
-                raise ContactNotFoundException(f"Contact not found with ID: {id}")
-            
-            # Update status
-            await collection.update_one(
-                {"_id": ObjectId(id)},
+
+            # Update and fetch the result in a single round-trip
+            updated = await collection.find_one_and_update(
+                {"_id": oid},
                 {
                     "$set": {
                         "status": status,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": utcnow()
                     }
-                }
+                },
+                return_document=ReturnDocument.AFTER
             )
-            
-            # Return updated document
-            updated = await collection.find_one({"_id": ObjectId(id)})
+            if not updated:
+                raise ContactNotFoundException(f"Contact not found with ID: {id}")
+
             return format_contact_response(updated)
             
         except (InvalidObjectIDException, ContactNotFoundException):
@@ -188,19 +196,19 @@ class ContactService:
         """
         try:
             collection = await get_contact_collection()
-            
-            total = await collection.count_documents({})
-            new = await collection.count_documents({"status": "new"})
-            reviewed = await collection.count_documents({"status": "reviewed"})
-            replied = await collection.count_documents({"status": "replied"})
-            archived = await collection.count_documents({"status": "archived"})
-            
+
+            # Single $group pipeline instead of one count query per status
+            pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+            buckets = {}
+            async for row in collection.aggregate(pipeline):
+                buckets[row["_id"]] = row["count"]
+
             return {
-                "total": total,
-                "new": new,
-                "reviewed": reviewed,
-                "replied": replied,
-                "archived": archived
+                "total": sum(buckets.values()),
+                "new": buckets.get("new", 0),
+                "reviewed": buckets.get("reviewed", 0),
+                "replied": buckets.get("replied", 0),
+                "archived": buckets.get("archived", 0)
             }
             
         except Exception as e:
@@ -3,16 +3,70 @@ Content Service
 Handles all business logic for content management
 """
 
+import asyncio
+import base64
+import time
+
+import orjson
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
-from bson import ObjectId
 from datetime import datetime
+from pymongo import ReturnDocument
 import logging
 
 from ..core import get_content_collection, InvalidObjectIDException, ContentNotFoundException, DatabaseException
-from ..utils import is_valid_object_id, format_content_response, create_list_response
+from ..schemas import ContentCreate, ContentUpdate
+from ..utils import to_oid, utcnow, format_content_response, create_list_response
 
 logger = logging.getLogger(__name__)
 
+# In-process TTL cache for single-content reads. Articles are read-mostly,
+# so most GETs can skip the MongoDB round-trip entirely.
+_CONTENT_CACHE_TTL = 60.0
+_CONTENT_CACHE_MAX_SIZE = 1024
+_content_cache: Dict[str, Any] = {}
+
+# List views are cards - never ship the heavy body over the wire
+_LIST_PROJECTION = {"body": 0}
+
+# The only update fields that may be removed from a stored document;
+# explicit nulls on required fields are rejected at the schema layer
+_UNSETTABLE_FIELDS = {"summary"}
+
+# Short-lived cache for count queries keyed by (category, type)
+_COUNT_CACHE_TTL = 5.0
+_count_cache: Dict[Any, Any] = {}
+
+
+def _cache_get_content(id: str) -> Optional[Dict[str, Any]]:
+    """Get a cached content document if the entry is still fresh"""
+    entry = _content_cache.get(id)
+    if entry is None:
+        return None
+    expires_at, document = entry
+    if time.monotonic() >= expires_at:
+        _content_cache.pop(id, None)
+        return None
+    return document
+
+
+def _cache_put_content(id: str, document: Dict[str, Any]) -> None:
+    """Cache a content document, evicting the oldest entry when full"""
+    if len(_content_cache) >= _CONTENT_CACHE_MAX_SIZE:
+        _content_cache.pop(next(iter(_content_cache)), None)
+    _content_cache[id] = (time.monotonic() + _CONTENT_CACHE_TTL, document)
+
+
+def _cache_invalidate_content(id: str) -> None:
+    """Remove a content document from the cache (on update/delete)"""
+    _content_cache.pop(id, None)
+
+
+@lru_cache(maxsize=512)
+def _search_clause(search: str) -> Dict[str, str]:
+    """Build the $text clause for a search term, cached per term"""
+    return {"$search": search}
+
 
 class ContentService:
     """Service for managing content operations"""
@@ -37,21 +91,29 @@ class ContentService:
         try:
             collection = await get_content_collection()
             
+            # $text rides the text index from init_indexes instead of
+            # regex-scanning the whole collection; results sort by relevance
             query = {}
+            projection = dict(_LIST_PROJECTION)
+            sort_spec = [("date", -1)]
             if search:
-                query["$or"] = [
-                    {"title": {"$regex": search, "$options": "i"}},
-                    {"body": {"$regex": search, "$options": "i"}},
-                    {"summary": {"$regex": search, "$options": "i"}},
-                ]
-            
-            total = await collection.count_documents(query)
-            
-            cursor = collection.find(query).skip(skip).limit(limit).sort("date", -1)
-            items = []
-            async for document in cursor:
-                items.append(format_content_response(document))
-            
+                query["$text"] = _search_clause(search)
+                projection["score"] = {"$meta": "textScore"}
+                sort_spec = [("score", {"$meta": "textScore"})]
+
+            # One await for the whole page; batch size matches the page so
+            # no getMore round-trips are needed. Count and page fetch run
+            # concurrently - they are independent round-trips.
+            cursor = (
+                collection.find(query, projection)
+                .skip(skip).limit(limit).sort(sort_spec).batch_size(limit)
+            )
+            total, docs = await asyncio.gather(
+                collection.count_documents(query),
+                cursor.to_list(length=limit)
+            )
+            items = [format_content_response(d) for d in docs]
+
             return create_list_response(items, total, skip, limit)
             
         except Exception as e:
@@ -83,26 +145,122 @@ class ContentService:
             collection = await get_content_collection()
             
             query = {"category": category, "type": type}
+            projection = dict(_LIST_PROJECTION)
+            sort_spec = [("date", -1)]
             if search:
-                query["$or"] = [
-                    {"title": {"$regex": search, "$options": "i"}},
-                    {"body": {"$regex": search, "$options": "i"}},
-                    {"summary": {"$regex": search, "$options": "i"}},
-                ]
-            
-            total = await collection.count_documents(query)
-            
-            cursor = collection.find(query).skip(skip).limit(limit).sort("date", -1)
-            items = []
-            async for document in cursor:
-                items.append(format_content_response(document))
-            
+                query["$text"] = _search_clause(search)
+                projection["score"] = {"$meta": "textScore"}
+                sort_spec = [("score", {"$meta": "textScore"})]
+
+            # One await for the whole page; batch size matches the page so
+            # no getMore round-trips are needed. Count and page fetch run
+            # concurrently - they are independent round-trips.
+            cursor = (
+                collection.find(query, projection)
+                .skip(skip).limit(limit).sort(sort_spec).batch_size(limit)
+            )
+            total, docs = await asyncio.gather(
+                collection.count_documents(query),
+                cursor.to_list(length=limit)
+            )
+            items = [format_content_response(d) for d in docs]
+
             return create_list_response(items, total, skip, limit)
             
         except Exception as e:
             logger.error(f"Error fetching contents for {category}/{type}: {str(e)}")
             raise DatabaseException(f"Failed to fetch filtered contents: {str(e)}")
     
+    @staticmethod
+    async def get_all_contents_cursor(
+        after: Optional[str] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Get contents with keyset pagination on (date, _id)
+
+        Unlike skip/limit, cost stays constant regardless of how deep
+        the caller pages.
+
+        Args:
+            after: Opaque cursor from a previous page, or None for the first
+            limit: Number of records to return
+
+        Returns:
+            Dictionary with items and the next_cursor (None on the last page)
+        """
+        try:
+            collection = await get_content_collection()
+
+            query = {}
+            if after:
+                try:
+                    decoded = base64.urlsafe_b64decode(after.encode()).decode()
+                    date_str, last_id = decoded.split("|", 1)
+                    after_date = datetime.fromisoformat(date_str)
+                except (ValueError, TypeError):
+                    raise InvalidObjectIDException(f"Invalid pagination cursor: {after}")
+                after_oid = to_oid(last_id)
+                query = {"$or": [
+                    {"date": {"$lt": after_date}},
+                    {"date": after_date, "_id": {"$lt": after_oid}},
+                ]}
+
+            cursor = (
+                collection.find(query)
+                .sort([("date", -1), ("_id", -1)]).limit(limit).batch_size(limit)
+            )
+            docs = await cursor.to_list(length=limit)
+
+            # Encode the next cursor before formatting renames _id
+            next_cursor = None
+            if len(docs) == limit and docs[-1].get("date") is not None:
+                last = docs[-1]
+                next_cursor = base64.urlsafe_b64encode(
+                    f"{last['date'].isoformat()}|{last['_id']}".encode()
+                ).decode()
+
+            items = [format_content_response(d) for d in docs]
+            return {"items": items, "next_cursor": next_cursor}
+
+        except InvalidObjectIDException:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching contents by cursor: {str(e)}")
+            raise DatabaseException(f"Failed to fetch contents: {str(e)}")
+
+    @staticmethod
+    async def stream_all_contents(
+        category: Optional[str] = None,
+        type: Optional[str] = None
+    ):
+        """
+        Stream all matching contents as NDJSON lines
+
+        Yields one serialized document at a time straight off the Motor
+        cursor, so memory stays constant no matter how large the dump is.
+
+        Args:
+            category: Filter by category (optional)
+            type: Filter by type (optional)
+
+        Yields:
+            NDJSON-encoded content documents (bytes, newline-terminated)
+        """
+        collection = await get_content_collection()
+
+        query = {}
+        if category:
+            query["category"] = category
+        if type:
+            query["type"] = type
+
+        # batch_size bounds in-flight memory while keeping getMore
+        # round-trips infrequent
+        cursor = collection.find(query).sort("date", -1).batch_size(500)
+        async for doc in cursor:
+            yield orjson.dumps(format_content_response(doc)) + b"\n"
+
     @staticmethod
     async def get_content_by_id(id: str) -> Dict[str, Any]:
         """
@@ -119,16 +277,21 @@ class ContentService:
             ContentNotFoundException: If content not found
         """
         try:
-            if not is_valid_object_id(id):
-                raise InvalidObjectIDException(f"Invalid content ID format: {id}")
-            
+            oid = to_oid(id)
+
+            cached = _cache_get_content(id)
+            if cached is not None:
+                return cached
+
             collection = await get_content_collection()
-            document = await collection.find_one({"_id": ObjectId(id)})
+            document = await collection.find_one({"_id": oid})
             
             if not document:
                 raise ContentNotFoundException(f"Content not found with ID: {id}")
             
-            return format_content_response(document)
+            formatted = format_content_response(document)
+            _cache_put_content(id, formatted)
+            return formatted
             
         except (InvalidObjectIDException, ContentNotFoundException):
             raise
@@ -157,13 +320,17 @@ class ContentService:
             collection = await get_content_collection()
             
             query = {"category": category}
-            total = await collection.count_documents(query)
-            
-            cursor = collection.find(query).skip(skip).limit(limit).sort("date", -1)
-            items = []
-            async for document in cursor:
-                items.append(format_content_response(document))
-            
+
+            cursor = (
+                collection.find(query, _LIST_PROJECTION)
+                .skip(skip).limit(limit).sort("date", -1).batch_size(limit)
+            )
+            total, docs = await asyncio.gather(
+                collection.count_documents(query),
+                cursor.to_list(length=limit)
+            )
+            items = [format_content_response(d) for d in docs]
+
             return create_list_response(items, total, skip, limit)
             
         except Exception as e:
@@ -171,49 +338,107 @@ class ContentService:
             raise DatabaseException(f"Failed to fetch category contents: {str(e)}")
     
     @staticmethod
-    async def create_content(content_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_content(
+        content: ContentCreate,
+        default_author: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Create new content
-        
+
         Args:
-            content_data: Content data
-            
+            content: Validated content data
+            default_author: Author to use when none was provided
+
         Returns:
             Created content document
         """
         try:
             collection = await get_content_collection()
-            
-            # Add metadata - use provided date or current date
+
+            # Serialize once, at the insert boundary
+            content_data = content.model_dump(exclude_none=True)
+
+            # Add author if not provided
+            if not content_data.get("author") and default_author:
+                content_data["author"] = default_author
+
+            # Ensure images is a list if provided
+            if isinstance(content_data.get("images"), str):
+                content_data["images"] = [content_data["images"]]
+
+            # Add metadata - one clock read for both timestamps
+            now = utcnow()
             if "date" not in content_data or not content_data.get("date"):
-                content_data["date"] = datetime.utcnow()
+                content_data["date"] = now
             else:
                 # Convert string date to datetime if needed
                 if isinstance(content_data["date"], str):
                     try:
                         content_data["date"] = datetime.fromisoformat(content_data["date"].replace('Z', '+00:00'))
                     except:
-                        content_data["date"] = datetime.utcnow()
-            content_data["created_at"] = datetime.utcnow()
-            
-            result = await collection.insert_one(content_data)
-            created = await collection.find_one({"_id": result.inserted_id})
+                        content_data["date"] = now
+            content_data["created_at"] = now
             
-            return format_content_response(created)
+            # insert_one fills in _id on the dict - no refetch needed
+            await collection.insert_one(content_data)
+
+            return format_content_response(content_data)
             
         except Exception as e:
             logger.error(f"Error creating content: {str(e)}")
             raise DatabaseException(f"Failed to create content: {str(e)}")
     
     @staticmethod
-    async def update_content(id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def bulk_create_contents(
+        items: List[ContentCreate],
+        default_author: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many contents in a single round-trip
+
+        Args:
+            items: Validated content items
+            default_author: Author to use when none was provided
+
+        Returns:
+            List of created content documents
+        """
+        try:
+            if not items:
+                return []
+
+            collection = await get_content_collection()
+
+            now = utcnow()
+            docs = []
+            for item in items:
+                content_data = item.model_dump(exclude_none=True)
+                if not content_data.get("author") and default_author:
+                    content_data["author"] = default_author
+                if not content_data.get("date"):
+                    content_data["date"] = now
+                content_data["created_at"] = now
+                docs.append(content_data)
+
+            # One insert_many instead of N inserts; unordered lets the
+            # server parallelize. _id is filled into each dict in place.
+            await collection.insert_many(docs, ordered=False)
+
+            return [format_content_response(d) for d in docs]
+
+        except Exception as e:
+            logger.error(f"Error bulk creating contents: {str(e)}")
+            raise DatabaseException(f"Failed to bulk create contents: {str(e)}")
+
+    @staticmethod
+    async def update_content(id: str, content: ContentUpdate) -> Dict[str, Any]:
         """
         Update existing content
-        
+
         Args:
             id: Content ID
-            update_data: Fields to update
-            
+            content: Validated fields to update
+
         Returns:
             Updated content document
             
@@ -222,28 +447,42 @@ class ContentService:
             ContentNotFoundException: If content not found
         """
         try:
-            if not is_valid_object_id(id):
-                raise InvalidObjectIDException(f"Invalid content ID format: {id}")
-            
+            oid = to_oid(id)
+
             collection = await get_content_collection()
-            
-            # Check if content exists
-            existing = await collection.find_one({"_id": ObjectId(id)})
-            if not existing:
-                raise ContentNotFoundException(f"Content not found with ID: {id}")
-            
-            # Remove None values
-            update_data = {k: v for k, v in update_data.items() if v is not None}
-            
+
+            # Serialize once, keeping only fields the caller actually sent
+            # so an explicit null is distinguishable from "not provided"
+            update_data = content.model_dump(exclude_unset=True)
+
             if update_data:
-                update_data["updated_at"] = datetime.utcnow()
-                await collection.update_one(
-                    {"_id": ObjectId(id)},
-                    {"$set": update_data}
+                # Explicit nulls become $unset instead of being dropped
+                set_ops: Dict[str, Any] = {}
+                unset_ops: Dict[str, Any] = {}
+                for key, value in update_data.items():
+                    if value is not None:
+                        set_ops[key] = value
+                    elif key in _UNSETTABLE_FIELDS:
+                        unset_ops[key] = ""
+                set_ops["updated_at"] = utcnow()
+
+                update_doc: Dict[str, Any] = {"$set": set_ops}
+                if unset_ops:
+                    update_doc["$unset"] = unset_ops
+
+                # Update and fetch the result in a single round-trip
+                updated = await collection.find_one_and_update(
+                    {"_id": oid},
+                    update_doc,
+                    return_document=ReturnDocument.AFTER
                 )
-            
-            # Return updated document
-            updated = await collection.find_one({"_id": ObjectId(id)})
+            else:
+                updated = await collection.find_one({"_id": oid})
+
+            if not updated:
+                raise ContentNotFoundException(f"Content not found with ID: {id}")
+
+            _cache_invalidate_content(id)
             return format_content_response(updated)
             
         except (InvalidObjectIDException, ContentNotFoundException):
@@ -267,12 +506,12 @@ class ContentService:
             InvalidObjectIDException: If ID format is invalid
         """
         try:
-            if not is_valid_object_id(id):
-                raise InvalidObjectIDException(f"Invalid content ID format: {id}")
-            
+            oid = to_oid(id)
+
             collection = await get_content_collection()
-            result = await collection.delete_one({"_id": ObjectId(id)})
-            
+            result = await collection.delete_one({"_id": oid})
+
+            _cache_invalidate_content(id)
             return result.deleted_count > 0
             
         except InvalidObjectIDException:
@@ -297,6 +536,11 @@ class ContentService:
             Count of matching contents
         """
         try:
+            cache_key = (category, type)
+            entry = _count_cache.get(cache_key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+
             collection = await get_content_collection()
             
             query = {}
@@ -305,7 +549,9 @@ class ContentService:
             if type:
                 query["type"] = type
             
-            return await collection.count_documents(query)
+            count = await collection.count_documents(query)
+            _count_cache[cache_key] = (time.monotonic() + _COUNT_CACHE_TTL, count)
+            return count
             
         except Exception as e:
             logger.error(f"Error counting contents: {str(e)}")
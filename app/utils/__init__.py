@@ -1,7 +1,11 @@
 """Utility package initialization"""
 
 from .helpers import (
+    utcnow,
+    build_content_model,
+    build_contact_model,
     is_valid_object_id,
+    to_oid,
     convert_to_object_id,
     format_content_response,
     format_contact_response,
@@ -12,7 +16,11 @@ from .helpers import (
 )
 
 __all__ = [
+    "utcnow",
+    "build_content_model",
+    "build_contact_model",
     "is_valid_object_id",
+    "to_oid",
     "convert_to_object_id",
     "format_content_response",
     "format_contact_response",
@@ -4,27 +4,85 @@ Common functions used across the application
 """
 
 from bson import ObjectId
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 import logging
+import re
+
+from ..core.exceptions import InvalidObjectIDException
+from ..schemas import ContactResponse, ContentResponse
 
 logger = logging.getLogger(__name__)
 
 
+def build_content_model(doc: Dict[str, Any]) -> ContentResponse:
+    """
+    Build a ContentResponse from an already-formatted document
+    Uses model_construct to skip re-validating trusted DB data
+
+    Args:
+        doc: Formatted content document (id already a string)
+
+    Returns:
+        ContentResponse instance
+    """
+    return ContentResponse.model_construct(**doc)
+
+
+def build_contact_model(doc: Dict[str, Any]) -> ContactResponse:
+    """
+    Build a ContactResponse from an already-formatted document
+    Uses model_construct to skip re-validating trusted DB data
+
+    Args:
+        doc: Formatted contact document (id already a string)
+
+    Returns:
+        ContactResponse instance
+    """
+    return ContactResponse.model_construct(**doc)
+
+
+def utcnow() -> datetime:
+    """
+    Get the current UTC time as a timezone-aware datetime
+    Replacement for the deprecated datetime.utcnow()
+
+    Returns:
+        Timezone-aware datetime in UTC
+    """
+    return datetime.now(timezone.utc)
+
+
 def is_valid_object_id(id_str: str) -> bool:
     """
     Validate if a string is a valid MongoDB ObjectId
-    
+
     Args:
         id_str: String to validate
-        
+
     Returns:
         bool: True if valid ObjectId, False otherwise
     """
-    try:
-        ObjectId(id_str)
-        return True
-    except (TypeError, ValueError):
-        return False
+    return ObjectId.is_valid(id_str)
+
+
+def to_oid(id_str: str) -> ObjectId:
+    """
+    Validate and convert an ID string to ObjectId in one pass
+
+    Args:
+        id_str: String to convert
+
+    Returns:
+        ObjectId for the string
+
+    Raises:
+        InvalidObjectIDException: If the string is not a valid ObjectId
+    """
+    if not ObjectId.is_valid(id_str):
+        raise InvalidObjectIDException(f"Invalid ID format: {id_str}")
+    return ObjectId(id_str)
 
 
 def convert_to_object_id(id_str: str) -> Optional[ObjectId]:
@@ -47,42 +105,42 @@ def format_content_response(content: Dict[str, Any]) -> Dict[str, Any]:
     """
     Format content document for API response
     Converts MongoDB ObjectId to string
-    
+
     Args:
         content: Content document from database
-        
+
     Returns:
         Formatted content dictionary
     """
+    # Motor documents are fresh dicts owned by the caller - rename the
+    # id key in place instead of copying the whole document
     if not content:
         return {}
-    
-    formatted = dict(content)
-    if "_id" in formatted:
-        formatted["id"] = str(formatted.pop("_id"))
-    
-    return formatted
+
+    if "_id" in content:
+        content["id"] = str(content.pop("_id"))
+
+    return content
 
 
 def format_contact_response(contact: Dict[str, Any]) -> Dict[str, Any]:
     """
     Format contact document for API response
     Converts MongoDB ObjectId to string
-    
+
     Args:
         contact: Contact document from database
-        
+
     Returns:
         Formatted contact dictionary
     """
     if not contact:
         return {}
-    
-    formatted = dict(contact)
-    if "_id" in formatted:
-        formatted["id"] = str(formatted.pop("_id"))
-    
-    return formatted
+
+    if "_id" in contact:
+        contact["id"] = str(contact.pop("_id"))
+
+    return contact
 
 
 def paginate_query(skip: int = 0, limit: int = 10) -> tuple:
@@ -145,6 +203,12 @@ def create_list_response(items: list, total: int, skip: int, limit: int) -> Dict
     }
 
 
+# Compiled once at import; the translate table strips control characters
+# (except tab/newline/CR, which the whitespace collapse handles anyway)
+_WS_RE = re.compile(r"\s+")
+_CTRL = str.maketrans("", "", "".join(chr(c) for c in range(32) if c not in (9, 10, 13)))
+
+
 def sanitize_input(text: str) -> str:
     """
     Sanitize user input
@@ -156,10 +220,4 @@ def sanitize_input(text: str) -> str:
     Returns:
         Sanitized text
     """
-    if not text:
-        return ""
-    
-    # Remove extra whitespace
-    text = " ".join(text.split())
-    
-    return text
+    return _WS_RE.sub(" ", text.translate(_CTRL)).strip() if text else ""